@@ -4,52 +4,217 @@ Simple Python-based CLI video player (pp - python player)
 """
 
 import argparse
-import cv2
+import importlib
 import os
 import sys
 import json
 import time
 import threading
+import queue
 import subprocess
 import signal
 import logging
-import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from math import ceil
+from operator import attrgetter
 from pathlib import Path
 from typing import List, Dict, Optional
 
+try:
+    import orjson  # Optional: faster timestamp (de)serialization
+except ImportError:
+    orjson = None
+
 __version__ = "0.1.0"
 
+# Supported video extensions
+VIDEO_EXTENSIONS = frozenset({'.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm', '.m4v'})
+
+# Saved playback positions: one [key, value] JSON record per line, the last record for a key wins
+_TS_PATH = Path(os.path.expanduser('~/.pp_timestamps.jsonl'))
+_LEGACY_TS_PATH = Path(os.path.expanduser('~/.pp_timestamps.json'))
+
+# Seconds before indexing a video's keyframes is given up
+KEYFRAME_PROBE_TIMEOUT = 60
+
+
+class LazyModule:
+    """Stand-in for a module that is only imported on first attribute access"""
+
+    def __init__(self, name: str):
+        self.module_name = name
+        self.module = None
+
+    def __getattr__(self, attr):
+        # Only called for names not yet in the instance dict
+        if self.module is None:
+            self.module = importlib.import_module(self.module_name)
+        value = getattr(self.module, attr)
+        # Cache it, so per-frame lookups like cv2.resize cost a plain attribute access from now on
+        setattr(self, attr, value)
+        return value
+
+
+# OpenCV and NumPy take a noticeable part of startup; `pp --help` needs neither
+cv2 = LazyModule('cv2')
+np = LazyModule('numpy')
+
+
+def dumps(obj) -> bytes:
+    """Serialize to JSON bytes, with orjson when installed"""
+    return orjson.dumps(obj) if orjson else json.dumps(obj).encode()
+
+
+def loads(data):
+    """Parse JSON bytes, with orjson when installed"""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def ffmpeg_hwaccel() -> str:
+    """Name of the FFmpeg hardware decoding API for this platform"""
+    if sys.platform == 'darwin':
+        return 'videotoolbox'
+    if sys.platform == 'win32':
+        return 'd3d11va'
+    return 'vaapi'
+
+
+def release_prefetched(future):
+    """Release a capture opened in the background that is no longer needed"""
+    if future.exception() is None:
+        future.result().release()
+
+
+def start_keyframe_probe(video_path: Path) -> Optional[subprocess.Popen]:
+    """Start ffprobe listing the packets of the video stream, or None if ffprobe is unavailable"""
+    try:
+        # Packet flags are read by the demuxer alone, nothing gets decoded
+        return subprocess.Popen(
+            ['ffprobe', '-v', 'error', '-select_streams', 'v:0',
+             '-show_entries', 'packet=pts_time,flags', '-of', 'csv=p=0', str(video_path)],
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+        )
+    except FileNotFoundError:
+        return None
+
+
+def read_keyframes(process: subprocess.Popen, timeout: float = KEYFRAME_PROBE_TIMEOUT) -> Optional[List[float]]:
+    """Collect keyframe times (seconds) from a started probe, or None if it failed, timed out or was killed"""
+    try:
+        output, _ = process.communicate(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.communicate()
+        return None
+    if process.returncode != 0:
+        return None
+
+    times = []
+    for line in output.decode(errors='replace').splitlines():
+        pts_time, _, flags = line.partition(',')
+        if 'K' in flags and pts_time not in ('', 'N/A'):
+            times.append(float(pts_time))
+    times.sort()
+    return times
+
+
 class VideoPlayer:
-    def __init__(self, path: str, seek_short: int = 10, seek_long: int = 60, throttle_delay: float = 0.2, continuous: bool = False):
+    video_extensions = VIDEO_EXTENSIONS  # Shared by all instances
+
+    def __init__(self, path: str, seek_short: int = 10, seek_long: int = 60, throttle_delay: float = 0.2, continuous: bool = False,
+                 decode_threads: int = 0):
         self.path = Path(path)
         self.seek_short = seek_short  # seconds
         self.seek_long = seek_long    # seconds
         self.throttle_delay = throttle_delay  # seconds
         self.continuous = continuous  # auto-advance to next video
+        self.decode_threads = decode_threads  # FFmpeg decoder threads, 0 = one per core
         self.video_files = []
         self.current_index = 0
         self.is_playing = True
         self.is_muted = False
-        self.timestamps = {}  # Store last watched timestamps
+        self.timestamps = {}  # Store last watched timestamps, keyed by video_key()
+        self.changed_keys = set()  # Timestamp keys to append on the next save
+        self.timestamp_records = 0  # Records in the timestamp file, including superseded ones
+        self.timestamps_torn = False  # Timestamp file ends mid-record, without its newline
+        self.current_key = None  # video_key() of the loaded video
+        self.video_loaded_at = 0  # time.monotonic() when the current video was loaded
+        self.min_watch_time = 5  # seconds watched before a position is remembered
         self.cap = None
         self.fps = 30
         self.frame_count = 0
-        self.current_frame = 0
+        self.current_frame = 0  # Index of the next frame to display
+        self.duration = 0  # seconds
         self.playback_speed = 1.0  # Default playback speed
+        self.frame_step = 1  # Frames advanced per displayed frame; >1 when playing faster than 2x
+        self.running = False  # Playback loop active
+        self.next_deadline = 0  # time.monotonic() at which the next frame is due
+        self.frame_interval = 1.0 / self.fps  # Seconds between displayed frames, see update_frame_interval
 
         # Status display
         self.status_text = ""
         self.status_start_time = 0
         self.status_duration = 2.5  # Show status for 2.5 seconds
-        self.available_fonts = self.get_available_fonts()
+        self.status_drawer = None  # (key, function) blending the status box into frames
+        self.last_title = None  # Window title currently shown
+        self._available_fonts = None  # Probed on first use, see available_fonts
 
         # Audio support using ffplay
         self.audio_process = None
+        self.reap_q = queue.Queue()  # Stopped audio processes still to be waited for
+        self.reaper_thread = None
 
         # Throttling for seek operations
         self.pending_seek_operations = []
-        self.seek_throttle_timer = None
-        self.execute_pending_seek = False  # Flag to execute seeks in main thread
+        self.pending_seek_offset = 0  # Seconds from seek() calls that joined a burst, never multiplied
+        self.seek_deadline = 0  # time.monotonic() at which pending seeks are executed
+
+        # Background decoding: a worker thread feeds decoded frames to the display loop
+        self.frame_q = queue.Queue(maxsize=4)
+        self.seek_gen = 0  # Bumped whenever queued frames become stale (seek, video change)
+        self.cap_lock = threading.Lock()  # Guards self.cap between decoder and main thread
+        self.decode_enabled = threading.Event()  # Cleared while paused or at end of video
+        self.decode_stop = threading.Event()
+        self.decode_thread = None
+        self.frames_to_skip = 0  # Frames the decoder should grab() past to catch up
+        self.display_size = None  # (width, height) of the window's image area
+
+        # Next video's capture is opened ahead of time so switching doesn't stall
+        self.executor = None  # Created when playback starts
+        self.prefetch = None  # (index, future) of the capture being opened
+        self.keyframes = None  # Sorted keyframe frame indices of the current video, once known
+
+        # Keyframe indexing waits on ffprobe in its own worker, so prefetching never queues behind it
+        self.probe_executor = None  # Created when playback starts
+        self.probe_process = None  # ffprobe indexing the current video
+        self.keyframe_times = {}  # Video key -> keyframe times (seconds), kept for this session only
+        self.keyframe_q = queue.Queue()  # (video key, times) from the probe worker, applied by the main loop
+
+        # Key codes -> actions, looked up with a single dict access per keypress.
+        # Arrow keys report 81-84 on Linux/Windows and 0-3 on macOS.
+        self._keymap = {
+            ord('q'): self.quit,
+            27: self.quit,  # ESC
+            ord(' '): self.toggle_pause,
+            ord('m'): self.toggle_mute,
+            81: partial(self.throttled_seek, -self.seek_short),  # Left
+            2: partial(self.throttled_seek, -self.seek_short),
+            83: partial(self.throttled_seek, self.seek_short),  # Right
+            3: partial(self.throttled_seek, self.seek_short),
+            82: partial(self.throttled_seek, self.seek_long),  # Up
+            0: partial(self.throttled_seek, self.seek_long),
+            84: partial(self.throttled_seek, -self.seek_long),  # Down
+            1: partial(self.throttled_seek, -self.seek_long),
+            ord('s'): self.jump_to_start,
+            ord('e'): self.jump_to_end,
+            ord('j'): self.prev_video,
+            # Always allow next video, whether playing or paused
+            ord('k'): self.next_video,
+            13: self.next_video,  # Enter
+            ord(']'): self.speed_up,
+            ord('['): self.speed_down,
+        }
 
         # Setup logging first (needed by other methods)
         self.setup_logging()
@@ -57,22 +222,19 @@ class VideoPlayer:
         # Check audio availability after logging is set up
         self.audio_available = self.check_ffplay_available()
 
-        # Supported video extensions
-        self.video_extensions = {'.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm', '.m4v'}
+        # Load saved timestamps (holds the directory listing cache)
+        self.load_timestamps()
 
         # Load video files
         self.load_video_files()
 
-        # Load saved timestamps
-        self.load_timestamps()
-
     def setup_logging(self):
         """Setup logging configuration"""
         logging.basicConfig(
             level=logging.INFO,
             format='%(asctime)s - %(levelname)s - %(message)s',
             handlers=[
-                logging.FileHandler(Path.home() / '.pp_player.log'),
+                logging.FileHandler(Path.home() / '.pp_player.log', delay=True),  # Opened on first record
                 logging.StreamHandler(sys.stdout)
             ]
         )
@@ -81,7 +243,7 @@ class VideoPlayer:
     def show_status(self, message: str):
         """Show status message on screen for a few seconds"""
         self.status_text = message
-        self.status_start_time = time.time()
+        self.status_start_time = time.monotonic()
         self.logger.info(message)
 
     def get_available_fonts(self):
@@ -118,6 +280,13 @@ class VideoPlayer:
 
         return available
 
+    @property
+    def available_fonts(self):
+        """Fonts that render on this OpenCV build"""
+        if self._available_fonts is None:
+            self._available_fonts = self.get_available_fonts()
+        return self._available_fonts
+
     def get_working_font(self):
         """Get the first working font from available fonts"""
         return self.available_fonts[0] if self.available_fonts else cv2.FONT_HERSHEY_SIMPLEX
@@ -127,7 +296,7 @@ class VideoPlayer:
         if not self.status_text:
             return frame
 
-        current_time = time.time()
+        current_time = time.monotonic()
         elapsed = current_time - self.status_start_time
 
         if elapsed > self.status_duration:
@@ -141,10 +310,26 @@ class VideoPlayer:
         else:
             alpha = 1.0
 
-        # Create overlay
-        overlay = frame.copy()
+        # Layout only depends on the message and frame size, so the drawer is built once for both
         height, width = frame.shape[:2]
+        drawer_key = (self.status_text, width, height)
+        if self.status_drawer is None or self.status_drawer[0] != drawer_key:
+            draw = self.make_status_drawer(width, height)
+            if draw is None:
+                return frame
+            self.status_drawer = (drawer_key, draw)
 
+        # Blend with alpha for fade effect
+        try:
+            self.status_drawer[1](frame, alpha * 0.8)
+        except Exception:
+            # If blending fails, return original frame
+            return frame
+
+        return frame
+
+    def make_status_drawer(self, width: int, height: int):
+        """Build a function blending the current status box into frames of the given size"""
         # Get working font
         font = self.get_working_font()
         font_scale = 0.8
@@ -181,26 +366,25 @@ class VideoPlayer:
         bg_x2 = min(width, bg_x2)
         bg_y2 = min(height, bg_y2)
 
-        try:
-            # Draw semi-transparent background
-            cv2.rectangle(overlay, (bg_x1, bg_y1), (bg_x2, bg_y2), (0, 0, 0), -1)
+        if bg_x2 <= bg_x1 or bg_y2 <= bg_y1:
+            return None
 
-            # Draw status text
-            cv2.putText(overlay, self.status_text, (text_x, text_y), 
-                       font, font_scale, (255, 255, 255), thickness)
+        # The status box (text on black) is rendered once, only the box region is blended
+        text_mask = np.zeros((bg_y2 - bg_y1, bg_x2 - bg_x1), dtype=np.uint8)
+        try:
+            cv2.putText(text_mask, self.status_text, (text_x - bg_x1, text_y - bg_y1),
+                       font, font_scale, 255, thickness)
         except Exception as e:
             # If drawing fails, log but don't crash
             self.logger.warning(f"Failed to draw status overlay: {e}")
-            return frame
+            return None
 
-        # Blend with alpha for fade effect
-        try:
-            frame = cv2.addWeighted(frame, 1 - alpha * 0.8, overlay, alpha * 0.8, 0)
-        except Exception:
-            # If blending fails, return original frame
-            return frame
+        box = cv2.cvtColor(text_mask, cv2.COLOR_GRAY2BGR)
 
-        return frame
+        def draw(frame, weight):
+            roi = frame[bg_y1:bg_y2, bg_x1:bg_x2]
+            cv2.addWeighted(roi, 1 - weight, box, weight, 0, dst=roi)
+        return draw
 
     def load_video_files(self):
         """Load all video files from the given path"""
@@ -215,13 +399,26 @@ class VideoPlayer:
             self.logger.error(f"Path {directory} does not exist")
             sys.exit(1)
 
-        # Find all video files
-        for file_path in directory.iterdir():
-            if file_path.is_file() and file_path.suffix.lower() in self.video_extensions:
-                self.video_files.append(file_path)
+        # Reuse the cached listing while the directory is unchanged
+        dir_key = '__dir__:' + str(directory.resolve())
+        mtime_ns = directory.stat().st_mtime_ns
+        cached = self.timestamps.get(dir_key)
+        if cached and cached['mtime_ns'] == mtime_ns:
+            self.video_files = [directory / name for name in cached['files']]
+        else:
+            # Find all video files; scandir entries carry the file type, so no stat per regular file
+            with os.scandir(directory) as entries:
+                self.video_files = [
+                    Path(entry.path) for entry in entries
+                    if entry.is_file()
+                    and os.path.splitext(entry.name)[1].lower() in self.video_extensions
+                ]
+
+            # Sort files for consistent ordering (all share the same directory)
+            self.video_files.sort(key=attrgetter('name'))
 
-        # Sort files for consistent ordering
-        self.video_files.sort()
+            self.timestamps[dir_key] = {'mtime_ns': mtime_ns, 'files': [f.name for f in self.video_files]}
+            self.changed_keys.add(dir_key)
 
         if not self.video_files:
             self.logger.error(f"No video files found in {directory}")
@@ -235,22 +432,97 @@ class VideoPlayer:
 
     def load_timestamps(self):
         """Load saved timestamps from file"""
-        timestamp_file = Path.home() / '.pp_timestamps.json'
-        if timestamp_file.exists():
+        self.timestamps = {}
+        if _TS_PATH.exists():
+            try:
+                data = _TS_PATH.read_bytes()
+            except OSError:
+                return
+            lines = data.splitlines()
+            self.timestamps_torn = bool(data) and not data.endswith(b'\n')
+            for line in lines:
+                try:
+                    key, value = loads(line)
+                except (ValueError, TypeError):
+                    continue  # Torn record from an interrupted write
+                if value is None:
+                    self.timestamps.pop(key, None)
+                else:
+                    self.timestamps[key] = value
+            self.timestamp_records = len(lines)
+        elif _LEGACY_TS_PATH.exists():
+            # Single JSON object written by older versions; converted on the next save
             try:
-                with open(timestamp_file, 'r') as f:
-                    self.timestamps = json.load(f)
+                self.timestamps = loads(_LEGACY_TS_PATH.read_bytes())
             except:
                 self.timestamps = {}
+            self.changed_keys.update(self.timestamps)
 
     def save_timestamps(self):
-        """Save current timestamps to file"""
-        timestamp_file = Path.home() / '.pp_timestamps.json'
+        """Append changed timestamps to file"""
+        if not self.changed_keys:
+            return
+
         try:
-            with open(timestamp_file, 'w') as f:
-                json.dump(self.timestamps, f)
-        except:
-            pass
+            # Only changed keys are appended (None marks a removed key), so saving
+            # doesn't grow with the number of remembered videos
+            keys = list(self.changed_keys)
+            data = b''.join(dumps([key, self.timestamps.get(key)]) + b'\n' for key in keys)
+            if self.timestamps_torn:
+                # Terminate the torn record so the first new one isn't glued onto it
+                data = b'\n' + data
+            fd = os.open(_TS_PATH, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, data)
+            finally:
+                os.close(fd)
+            self.timestamps_torn = False
+            self.changed_keys.difference_update(keys)
+            self.timestamp_records += len(keys)
+
+            # Rewrite without superseded records once they dominate the file
+            if self.timestamp_records > 2 * len(self.timestamps):
+                self.compact_timestamps()
+        except Exception as e:
+            self.logger.warning(f"Could not save timestamps: {e}")
+
+    def compact_timestamps(self):
+        """Rewrite the timestamp file with one record per key"""
+        tmp_file = _TS_PATH.with_suffix('.jsonl.tmp')
+        # Write to a temporary file and swap it in, so a crash never leaves a truncated file
+        tmp_file.write_bytes(b''.join(dumps([key, value]) + b'\n' for key, value in self.timestamps.items()))
+        os.replace(tmp_file, _TS_PATH)
+        self.timestamp_records = len(self.timestamps)
+        self.timestamps_torn = False
+
+    def video_key(self, video_path: Path) -> str:
+        """Get timestamp key identifying a video file, stable across moves and renames"""
+        try:
+            st = os.stat(video_path)
+        except OSError:
+            return str(video_path)
+        # Modified files get a new key, so stale positions are never restored
+        return f"{st.st_ino}:{st.st_size}:{st.st_mtime_ns}"
+
+    def remember_position(self) -> bool:
+        """Record the current position so the video resumes there next time"""
+        if self.cap is None or self.current_key is None:
+            return False
+
+        # Don't bookmark videos that were only skipped through
+        if time.monotonic() - self.video_loaded_at < self.min_watch_time:
+            return False
+
+        # A finished video starts over next time rather than reopening at its end
+        frame = 0 if 0 < self.frame_count - 1 <= self.current_frame else self.current_frame
+        # Stream info is kept alongside, sparing the backend lookups on the next visit
+        self.timestamps[self.current_key] = {'f': frame, 'fps': self.fps, 'n': self.frame_count}
+        self.changed_keys.add(self.current_key)
+        # Drop the legacy path-keyed entry for this video
+        legacy_key = str(self.video_files[self.current_index])
+        if self.timestamps.pop(legacy_key, None) is not None:
+            self.changed_keys.add(legacy_key)
+        return True
 
     def check_ffplay_available(self):
         """Check if ffplay is available on the system"""
@@ -265,20 +537,52 @@ class VideoPlayer:
 
     def stop_audio(self):
         """Stop current audio playback"""
-        if self.audio_process and self.audio_process.poll() is None:
-            try:
-                # Force kill the process group to prevent threading issues
-                if hasattr(os, 'killpg'):
-                    os.killpg(os.getpgid(self.audio_process.pid), signal.SIGKILL)
-                else:
-                    self.audio_process.kill()
-                self.audio_process.wait(timeout=1)
-            except (subprocess.TimeoutExpired, ProcessLookupError, OSError):
-                # Process already dead or can't be killed
-                pass
-            except Exception as e:
-                self.logger.warning(f"Error stopping audio: {e}")
+        process = self.audio_process
         self.audio_process = None
+        if process is None or process.poll() is not None:
+            return
+
+        try:
+            # SIGTERM lets ffplay close the audio device cleanly (SIGKILL can click)
+            if hasattr(os, 'killpg'):
+                pgid = os.getpgid(process.pid)
+                os.killpg(pgid, signal.SIGTERM)
+                # A paused (stopped) ffplay only acts on the signal once continued
+                os.killpg(pgid, signal.SIGCONT)
+            else:
+                process.terminate()
+        except (ProcessLookupError, OSError):
+            # Process already dead
+            pass
+        except Exception as e:
+            self.logger.warning(f"Error stopping audio: {e}")
+
+        # Wait briefly, then leave the process to the reaper instead of blocking the UI
+        for _ in range(10):
+            if process.poll() is not None:
+                return
+            time.sleep(0.01)
+        if self.reaper_thread is None:
+            self.reaper_thread = threading.Thread(target=self._reap_audio, daemon=True)
+            self.reaper_thread.start()
+        self.reap_q.put(process)
+
+    def _reap_audio(self):
+        """Collect audio processes that did not exit right after stop_audio"""
+        while True:
+            process = self.reap_q.get()
+            try:
+                process.wait(timeout=1)
+            except subprocess.TimeoutExpired:
+                # Ignored SIGTERM: force kill
+                try:
+                    if hasattr(os, 'killpg'):
+                        os.killpg(os.getpgid(process.pid), signal.SIGKILL)
+                    else:
+                        process.kill()
+                except (ProcessLookupError, OSError):
+                    pass
+                process.wait()
 
     def play_audio(self, video_path: Path, start_time: float = 0):
         """Play audio for the given video file using ffplay"""
@@ -289,9 +593,6 @@ class VideoPlayer:
             # Stop any existing audio
             self.stop_audio()
 
-            # Small delay to ensure process is fully terminated
-            time.sleep(0.1)
-
             # Build ffplay command
             cmd = [
                 'ffplay',
@@ -321,7 +622,9 @@ class VideoPlayer:
                 cmd,
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL,
-                preexec_fn=os.setsid if hasattr(os, 'setsid') else None
+                # New session so the whole process group can be signalled; unlike
+                # preexec_fn this runs no Python in the forked child
+                start_new_session=hasattr(os, 'setsid')
             )
 
         except Exception as e:
@@ -357,65 +660,331 @@ class VideoPlayer:
         # In a more advanced implementation, we could use ffmpeg filters
         if self.audio_process:
             current_video = self.video_files[self.current_index]
-            current_time = self.cap.get(cv2.CAP_PROP_POS_MSEC) / 1000.0 if self.cap else 0
+            current_time = self.get_position()
             self.stop_audio()
             self.play_audio(current_video, current_time)
 
+    def get_position(self) -> float:
+        """Get current playback position in seconds"""
+        # Derived from displayed frames; the capture itself runs ahead of the display
+        return self.current_frame / self.fps if self.fps > 0 else 0
+
+    def open_capture(self, video_path: Path):
+        """Open video capture, preferring hardware-accelerated decoding"""
+        params = []
+        # Hardware acceleration params need OpenCV >= 4.5.2
+        if hasattr(cv2, 'CAP_PROP_HW_ACCELERATION'):
+            # Let the backend pick the device; CAP_PROP_HW_DEVICE is rejected with ACCELERATION_ANY
+            params += [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY]
+        # Software decoding of H.264/H.265 scales with threads, most visibly at high speeds
+        if hasattr(cv2, 'CAP_PROP_N_THREADS'):
+            params += [cv2.CAP_PROP_N_THREADS, self.decode_threads]
+
+        if params:
+            cap = cv2.VideoCapture(str(video_path), cv2.CAP_FFMPEG, params)
+        else:
+            # Hardware decoding comes from OPENCV_FFMPEG_CAPTURE_OPTIONS (see main)
+            cap = cv2.VideoCapture(str(video_path), cv2.CAP_FFMPEG)
+
+        if not cap.isOpened():
+            cap.release()
+            self.logger.info(f"Hardware decoding unavailable for {video_path.name}, using software decoding")
+            # Fallback to default (software) decoding
+            cap = cv2.VideoCapture(str(video_path))
+
+        # Keep the backend from queueing frames that a seek would have to drain
+        if cap.isOpened() and not cap.set(cv2.CAP_PROP_BUFFERSIZE, 1):
+            self.logger.debug(f"Capture buffer size not adjustable for {video_path.name}")
+        return cap
+
     def load_video(self, index: int):
         """Load video at given index"""
         if 0 <= index < len(self.video_files):
-            # Save current timestamp before switching
-            if self.cap is not None:
-                current_time = self.cap.get(cv2.CAP_PROP_POS_MSEC) / 1000.0
-                self.timestamps[str(self.video_files[self.current_index])] = current_time
+            # Save current timestamp before switching; appending it right away
+            # keeps it even if the player doesn't exit cleanly
+            if self.remember_position():
+                self.save_timestamps()
 
             # Stop current audio
             self.stop_audio()
 
             self.current_index = index
             video_path = self.video_files[self.current_index]
+            self.current_key = self.video_key(video_path)
+            # Fall back to entries keyed by path, written by older versions (plain seconds)
+            saved = self.timestamps.get(self.current_key, self.timestamps.get(str(video_path), 0))
+
+            with self.cap_lock:
+                # Frames queued from the previous video are stale now
+                self._invalidate_frames()
+
+                if self.cap:
+                    self.cap.release()
+
+                self.cap = self.take_prefetched(index) or self.open_capture(video_path)
+                if not self.cap.isOpened():
+                    self.logger.error(f"Cannot open video {video_path}")
+                    # Nothing is loaded now: the previous video's stream info must not
+                    # be bookmarked under this file's key
+                    self.cap.release()
+                    self.cap = None
+                    self.current_key = None
+                    return False
+
+                if isinstance(saved, dict):
+                    # The key changes with the file, so cached stream info is still accurate
+                    self.fps = saved['fps']
+                    self.frame_count = saved['n']
+                    saved_frame = saved['f']
+                else:
+                    self.fps = self.cap.get(cv2.CAP_PROP_FPS)
+                    self.frame_count = int(self.cap.get(cv2.CAP_PROP_FRAME_COUNT))
+                    saved_frame = int(saved * self.fps)
+                self.duration = self.frame_count / self.fps if self.fps > 0 else 0
+                self.update_frame_interval()
+                self.current_frame = 0
+                self.load_keyframes(video_path)
+
+                # Restore timestamp if available; at or past the last frame, start over
+                if 0 < self.frame_count - 1 <= saved_frame:
+                    saved_frame = 0
+                if saved_frame > 0:
+                    self.cap.set(cv2.CAP_PROP_POS_FRAMES, saved_frame)
+                    self.current_frame = saved_frame
 
-            if self.cap:
-                self.cap.release()
-
-            self.cap = cv2.VideoCapture(str(video_path))
-            if not self.cap.isOpened():
-                self.logger.error(f"Cannot open video {video_path}")
-                return False
-
-            self.fps = self.cap.get(cv2.CAP_PROP_FPS)
-            self.frame_count = int(self.cap.get(cv2.CAP_PROP_FRAME_COUNT))
-
-            # Restore timestamp if available
-            saved_time = self.timestamps.get(str(video_path), 0)
-            if saved_time > 0:
-                self.cap.set(cv2.CAP_PROP_POS_MSEC, saved_time * 1000)
+            if self.is_playing:
+                self.decode_enabled.set()
+            self.video_loaded_at = time.monotonic()
 
             # Start audio playback
-            self.play_audio(video_path, saved_time)
+            self.play_audio(video_path, self.get_position())
 
             self.logger.info(f"Playing: {video_path.name} ({self.current_index + 1}/{len(self.video_files)})")
             self.show_status(f"Playing: {video_path.name}")
 
             # Update window title with video name
             self.update_window_title(video_path.name)
+
+            # Get the following video ready in the background
+            self.prefetch_next()
             return True
         return False
 
+    def load_keyframes(self, video_path: Path):
+        """Use the keyframe index of the current video if known, or build it in the background"""
+        self.keyframes = None
+        # The previous video's index is no longer needed
+        self.stop_keyframe_probe()
+        times = self.keyframe_times.get(self.current_key)
+        if times is not None:
+            self.set_keyframes(times)
+        elif self.probe_executor is not None:
+            process = start_keyframe_probe(video_path)
+            if process is not None:
+                self.probe_process = process
+                self.probe_executor.submit(self.collect_keyframes, self.current_key, process)
+
+    def collect_keyframes(self, key: str, process: subprocess.Popen):
+        """Wait for a keyframe probe and hand its result to the main loop (runs on the probe worker)"""
+        times = read_keyframes(process)
+        if times:
+            self.keyframe_q.put((key, times))
+
+    def apply_keyframes(self):
+        """Take in keyframe indexes finished in the background"""
+        while True:
+            try:
+                key, times = self.keyframe_q.get_nowait()
+            except queue.Empty:
+                return
+            self.keyframe_times[key] = times
+            # Converted with the fps of the video now playing, which may differ from when the probe started
+            if key == self.current_key:
+                self.set_keyframes(times)
+
+    def stop_keyframe_probe(self):
+        """Kill a keyframe probe that is still running"""
+        if self.probe_process is None:
+            return
+        if self.probe_process.poll() is None:
+            self.probe_process.kill()
+        self.probe_process = None
+
+    def set_keyframes(self, times: List[float]):
+        """Convert keyframe times to frame indices for seeking"""
+        if self.fps > 0 and times:
+            self.keyframes = np.rint(np.asarray(times) * self.fps).astype(np.int64)
+
+    def prefetch_next(self):
+        """Open the following video's capture in the background"""
+        if self.executor is None or len(self.video_files) < 2:
+            return
+        self.cancel_prefetch()
+        index = (self.current_index + 1) % len(self.video_files)
+        self.prefetch = (index, self.executor.submit(self.open_capture, self.video_files[index]))
+
+    def take_prefetched(self, index: int):
+        """Get the capture prefetched for index, if any"""
+        if self.prefetch is None or self.prefetch[0] != index:
+            self.cancel_prefetch()
+            return None
+        future = self.prefetch[1]
+        self.prefetch = None
+        return future.result()
+
+    def cancel_prefetch(self):
+        """Drop the prefetched capture, releasing it once opened"""
+        if self.prefetch is None:
+            return
+        future = self.prefetch[1]
+        self.prefetch = None
+        if not future.cancel():
+            future.add_done_callback(release_prefetched)
+
+    def _invalidate_frames(self):
+        """Discard decoded frames that no longer match the capture position (call with cap_lock held)"""
+        self.seek_gen += 1
+        self.frames_to_skip = 0
+        while True:
+            try:
+                self.frame_q.get_nowait()
+            except queue.Empty:
+                break
+
+    def _decode_worker(self):
+        """Decode frames in the background and queue them for display"""
+        # Frames are retrieved into a ring of reused buffers instead of a fresh array each.
+        # A buffer is only refilled once every slot has cycled: queued frames, the one on
+        # screen and the one being decoded never share memory.
+        buffers = [None] * (self.frame_q.maxsize + 2)
+        slot = 0
+
+        while not self.decode_stop.is_set():
+            if not self.decode_enabled.wait(timeout=0.1):
+                continue
+
+            with self.cap_lock:
+                if self.cap is None:
+                    # The last load failed: idle until a video is opened
+                    self.decode_enabled.clear()
+                    continue
+                gen = self.seek_gen
+
+                # Catching up or fast playback: grab() advances without converting
+                # the skipped frames, only the displayed one is retrieved
+                to_skip = self.frames_to_skip + self.frame_step - 1
+                skipped = 0
+                while skipped < to_skip and self.cap.grab():
+                    skipped += 1
+                self.frames_to_skip = 0
+
+                buf = buffers[slot]
+                ret, frame = self.cap.retrieve(buf) if self.cap.grab() else (False, None)
+                if ret and frame is not buf:
+                    # First frame or new resolution: OpenCV allocated, keep it for reuse
+                    buffers[slot] = frame
+                slot = (slot + 1) % len(buffers)
+                if not ret and gen == self.seek_gen:
+                    # End of video: idle until a seek or a new video
+                    self.decode_enabled.clear()
+
+            if ret:
+                frame = self.fit_to_display(frame)
+
+            # Drop frames invalidated by a seek while they were being decoded
+            while gen == self.seek_gen and not self.decode_stop.is_set():
+                try:
+                    self.frame_q.put((gen, ret, frame, skipped), timeout=0.1)
+                    break
+                except queue.Full:
+                    continue
+
+    def fit_to_display(self, frame):
+        """Downscale frames larger than the window, keeping the aspect ratio"""
+        if self.display_size is None:
+            return frame
+
+        height, width = frame.shape[:2]
+        scale = min(self.display_size[0] / width, self.display_size[1] / height)
+        if scale >= 1.0:
+            return frame
+
+        # Shrinking once here is cheaper than the GUI scaling a full-resolution frame
+        size = (max(1, int(width * scale)), max(1, int(height * scale)))
+        return cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+
+    def update_display_size(self):
+        """Refresh the window size frames are fitted to"""
+        try:
+            _, _, width, height = cv2.getWindowImageRect('Video Player')
+        except cv2.error:
+            return
+        self.display_size = (width, height) if width > 0 and height > 0 else None
+
+    def skip_frames(self, count: int):
+        """Have the decoder skip ahead when playback falls behind"""
+        with self.cap_lock:
+            self.frames_to_skip += count
+
+    def start_decoder(self):
+        """Start the background decode thread"""
+        self.decode_stop.clear()
+        self.decode_thread = threading.Thread(target=self._decode_worker, daemon=True)
+        self.decode_thread.start()
+
+    def stop_decoder(self):
+        """Stop the background decode thread"""
+        self.decode_stop.set()
+        if self.decode_thread:
+            self.decode_thread.join(timeout=1)
+            self.decode_thread = None
+
+    def clamp_frame(self, frame: int) -> int:
+        """Limit a frame index to the frames of the current video"""
+        return max(0, min(frame, self.frame_count - 1))
+
+    def _scrub_to(self, target_frame: int):
+        """Move to target frame, skipping intermediate frames with grab()"""
+        with self.cap_lock:
+            self._invalidate_frames()
+            self.current_frame = target_frame
+
+            keyframes = self.keyframes
+            if keyframes is not None:
+                # Jump straight to the closest keyframe at or before the target.
+                # grab() advances the stream without converting frames; only the
+                # frame displayed next is retrieved by the decoder.
+                i = np.searchsorted(keyframes, target_frame, side='right') - 1
+                start = int(keyframes[i]) if i >= 0 else 0
+                self.cap.set(cv2.CAP_PROP_POS_FRAMES, start)
+                for _ in range(target_frame - start):
+                    if not self.cap.grab():
+                        break
+            else:
+                # Frame indices are exact, unlike millisecond positions with fractional fps
+                self.cap.set(cv2.CAP_PROP_POS_FRAMES, target_frame)
+
+        # Resume decoding in case the end of the video had been reached
+        if self.is_playing:
+            self.decode_enabled.set()
+
     def seek(self, seconds: float):
         """Seek forward or backward by given seconds"""
         if self.cap is None:
             return
 
-        current_time = self.cap.get(cv2.CAP_PROP_POS_MSEC) / 1000.0
-        new_time = max(0, current_time + seconds)
+        # A throttled burst is pending: join it rather than racing its audio restart
+        if self.pending_seek_operations:
+            # Moves by exactly its own amount, without counting towards the fast seek multiplier
+            self.pending_seek_offset += seconds
+            return
 
         # Don't seek beyond video duration
-        duration = self.frame_count / self.fps
-        new_time = min(new_time, duration)
+        target_frame = self.clamp_frame(self.current_frame + int(seconds * self.fps))
 
         # Update video position
-        self.cap.set(cv2.CAP_PROP_POS_MSEC, new_time * 1000)
+        self._scrub_to(target_frame)
+        new_time = self.get_position()
 
         # Restart audio from new position to maintain sync
         if self.audio_available and self.audio_process:
@@ -429,11 +998,11 @@ class VideoPlayer:
             return
 
         # Don't seek beyond video duration
-        duration = self.frame_count / self.fps
-        position = max(0, min(position, duration))
+        target_frame = self.clamp_frame(int(position * self.fps))
 
         # Update video position
-        self.cap.set(cv2.CAP_PROP_POS_MSEC, position * 1000)
+        self._scrub_to(target_frame)
+        position = self.get_position()
 
         # Restart audio from new position to maintain sync
         if self.audio_available and self.audio_process:
@@ -446,20 +1015,14 @@ class VideoPlayer:
         # Add to pending operations
         self.pending_seek_operations.append(seconds)
 
-        # Cancel existing timer if any
-        if self.seek_throttle_timer:
-            self.seek_throttle_timer.cancel()
-
-        # Stop audio immediately to prevent assertion errors during rapid seeking
-        self.stop_audio()
-
-        # Start new timer to set flag for main thread execution
-        self.seek_throttle_timer = threading.Timer(self.throttle_delay, self.set_execute_seek_flag)
-        self.seek_throttle_timer.start()
+        # Frames decoded before the burst are stale; hold the decoder until the
+        # accumulated seek runs so the whole burst costs a single decode
+        with self.cap_lock:
+            self._invalidate_frames()
+            self.decode_enabled.clear()
 
-    def set_execute_seek_flag(self):
-        """Set flag for main thread to execute pending seeks"""
-        self.execute_pending_seek = True
+        # Each keypress pushes the deadline back; the main loop executes the burst once it passes
+        self.seek_deadline = time.monotonic() + self.throttle_delay
 
     def execute_throttled_seeks(self):
         """Execute accumulated seek operations"""
@@ -468,45 +1031,54 @@ class VideoPlayer:
 
         # Calculate total seek amount
         total_seek = sum(self.pending_seek_operations)
+        offset = self.pending_seek_offset
+        self.pending_seek_offset = 0
 
         # Apply throttling if too many operations
         if len(self.pending_seek_operations) >= 3:
             # For 3+ operations, use 5x multiplier for efficiency
             multiplier = 5.0
-            total_seek *= multiplier
+            total_seek = total_seek * multiplier + offset
             self.show_status(f"Fast seek: {total_seek:.0f}s ({len(self.pending_seek_operations)} ops)")
         else:
             # For 1-2 operations, show normal seek
+            total_seek += offset
             direction = "▶" if total_seek > 0 else "◀"
             self.show_status(f"{direction} {abs(total_seek):.0f}s")
 
         # Clear pending operations
         self.pending_seek_operations.clear()
-        self.execute_pending_seek = False
 
         # Execute the accumulated seek (safe from main thread)
         if self.cap is None:
             return
 
-        current_time = self.cap.get(cv2.CAP_PROP_POS_MSEC) / 1000.0
-        new_time = max(0, current_time + total_seek)
-
         # Don't seek beyond video duration
-        duration = self.frame_count / self.fps
-        new_time = min(new_time, duration)
+        target_frame = self.clamp_frame(self.current_frame + int(total_seek * self.fps))
 
         # Update video position
-        self.cap.set(cv2.CAP_PROP_POS_MSEC, new_time * 1000)
+        self._scrub_to(target_frame)
+        new_time = self.get_position()
 
-        # Restart audio from new position
+        # Restart audio once for the whole burst, at the final position
         if self.audio_available:
             current_video = self.video_files[self.current_index]
+            self.stop_audio()
             self.play_audio(current_video, new_time)
 
+    def update_frame_interval(self):
+        """Recompute the display interval after the frame rate or speed changes"""
+        fps = self.fps if self.fps > 0 else 30  # Some streams report no frame rate
+        self.frame_interval = self.frame_step / (fps * self.playback_speed)
+
     def change_playback_speed(self, delta: float):
         """Change playback speed by delta amount"""
         old_speed = self.playback_speed
         self.playback_speed = max(0.1, min(3.0, self.playback_speed + delta))
+        # Fast playback shows every Nth frame at the normal rate rather than
+        # decoding every frame at N times the rate
+        self.frame_step = max(1, int(self.playback_speed + 0.01))
+        self.update_frame_interval()
 
         if abs(self.playback_speed - old_speed) > 0.01:  # Only update if speed actually changed
             self.show_status(f"Speed: {self.playback_speed:.1f}x")
@@ -514,7 +1086,7 @@ class VideoPlayer:
             # Restart audio with new speed to maintain sync
             if self.audio_available and self.audio_process:
                 current_video = self.video_files[self.current_index]
-                current_time = self.cap.get(cv2.CAP_PROP_POS_MSEC) / 1000.0 if self.cap else 0
+                current_time = self.get_position()
                 self.stop_audio()
                 self.play_audio(current_video, current_time)
 
@@ -522,106 +1094,194 @@ class VideoPlayer:
         """Update window title with current video name"""
         speed_indicator = f" [{self.playback_speed:.1f}x]" if self.playback_speed != 1.0 else ""
         title = f"pp - {video_name} ({self.current_index + 1}/{len(self.video_files)}){speed_indicator}"
-        cv2.setWindowTitle('Video Player', title)
+        # Setting the title is a round-trip to the window system, skip it when unchanged
+        if title != self.last_title:
+            cv2.setWindowTitle('Video Player', title)
+            self.last_title = title
+
+    def create_window(self):
+        """Create the player window, using an OpenGL surface when available"""
+        try:
+            # OpenGL windows scale and present frames on the GPU
+            cv2.namedWindow('Video Player', cv2.WINDOW_NORMAL | cv2.WINDOW_OPENGL)
+        except cv2.error:
+            # OpenCV built without OpenGL support
+            self.logger.info("OpenGL display unavailable, using default window")
+            cv2.namedWindow('Video Player', cv2.WINDOW_NORMAL)
+
+    def quit(self):
+        """Stop the playback loop"""
+        self.running = False
+
+    def toggle_pause(self):
+        """Pause or resume playback"""
+        self.is_playing = not self.is_playing
+        if self.is_playing:
+            self.decode_enabled.set()
+            self.next_deadline = time.monotonic()
+            self.resume_audio()
+            self.show_status("Playing")
+        else:
+            self.decode_enabled.clear()
+            self.pause_audio()
+            self.show_status("Paused")
+
+    def toggle_mute(self):
+        """Mute or unmute audio"""
+        self.is_muted = not self.is_muted
+        self.set_audio_volume(self.is_muted)
+        self.show_status("Muted" if self.is_muted else "Unmuted")
+
+    def jump_to_start(self):
+        """Jump to start of video"""
+        self.seek_to_position(0)
+        self.show_status("Start of video")
+
+    def jump_to_end(self):
+        """Jump to end of video"""
+        self.seek_to_position(self.duration - 5)  # 5 seconds before end
+        self.show_status("End of video")
+
+    def speed_up(self):
+        """Speed up playback by 10%"""
+        self.change_playback_speed(0.1)
+        self.update_window_title(self.video_files[self.current_index].name)
+
+    def speed_down(self):
+        """Slow down playback by 10%"""
+        self.change_playback_speed(-0.1)
+        self.update_window_title(self.video_files[self.current_index].name)
 
     def play(self):
         """Main playback loop"""
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.probe_executor = ThreadPoolExecutor(max_workers=1)
         if not self.load_video(self.current_index):
+            self.executor.shutdown(wait=False)
+            self.probe_executor.shutdown(wait=False)
             return
 
-        cv2.namedWindow('Video Player', cv2.WINDOW_NORMAL)
+        self.create_window()
+        self.start_decoder()
 
-        # Calculate proper delay based on FPS
-        delay = int(1000 / self.fps) if self.fps > 0 else 33  # Default to ~30 FPS if fps is 0
-        last_frame_time = time.time()
+        # Frames are paced against a monotonic deadline; waitKey sleeps until it is due
+        self.next_deadline = time.monotonic()
+        shown_gen = None
+        next_window_check = 0
 
-        while True:
-            # Check for pending seek operations from timer thread
-            if self.execute_pending_seek:
-                self.execute_throttled_seeks()
+        # Bind per-frame callables to locals once
+        imshow = cv2.imshow
+        wait_key = cv2.waitKey
+        poll_key = getattr(cv2, 'pollKey', None) or partial(wait_key, 1)  # pollKey needs OpenCV 4.5
+        get_frame = self.frame_q.get_nowait
+        keymap = self._keymap
+        monotonic = time.monotonic
 
-            if self.is_playing:
-                current_time = time.time()
-                time_since_last_frame = current_time - last_frame_time
-
-                # Only read new frame if enough time has passed (adjusted for speed)
-                if time_since_last_frame >= (1.0 / (self.fps * self.playback_speed)):
-                    ret, frame = self.cap.read()
-                    if not ret:
-                        # End of video
-                        if self.continuous:
-                            # Auto-advance to next video
-                            self.next_video()
-                            # Update delay for new video
-                            delay = int(1000 / self.fps) if self.fps > 0 else 33
-                            last_frame_time = time.time()
-                            continue
-                        else:
-                            # Pause and wait for user input
-                            self.is_playing = False
-                            self.pause_audio()
-                            self.show_status("Video ended - Press Enter for next video")
-                            continue
+        self.running = True
+        try:
+            while self.running:
+                self.apply_keyframes()
 
-                    # Add status overlay
-                    frame_with_status = self.draw_status_overlay(frame)
-                    cv2.imshow('Video Player', frame_with_status)
-                    last_frame_time = current_time
+                # Execute pending seek operations once the burst has settled
+                if self.pending_seek_operations and monotonic() >= self.seek_deadline:
+                    self.execute_throttled_seeks()
 
-            # Handle keyboard input with proper delay
-            key = cv2.waitKey(1 if self.is_playing else 0) & 0xFF
+                # Track window resizes (once a second is plenty). Not before a frame has been
+                # shown: some backends size the window from its first image, and sampling the
+                # empty window would shrink every frame to its placeholder size
+                if shown_gen is not None and monotonic() >= next_window_check:
+                    self.update_display_size()
+                    next_window_check = monotonic() + 1.0
 
-            if key == ord('q') or key == 27:  # ESC key
-                break
-            elif key == ord(' '):  # Space - pause/play
-                self.is_playing = not self.is_playing
+                starved = False  # Waiting on the decoder rather than on the frame deadline
+                if self.is_playing:
+                    now = monotonic()
+
+                    # Only show new frame once its deadline is reached (adjusted for speed)
+                    if now >= self.next_deadline:
+                        try:
+                            gen, ret, frame, skipped = get_frame()
+                        except queue.Empty:
+                            # Decoder hasn't caught up yet
+                            gen = None
+
+                        if gen != self.seek_gen:
+                            # Nothing decoded yet, or a frame from before the last seek
+                            starved = True
+                        elif not ret:
+                            # End of video
+                            if self.continuous:
+                                # Auto-advance to next video
+                                self.next_video()
+                                continue
+                            else:
+                                # Pause and wait for user input
+                                self.is_playing = False
+                                self.pause_audio()
+                                self.show_status("Video ended - Press Enter for next video")
+                                continue
+                        else:
+                            # Add status overlay
+                            frame_with_status = self.draw_status_overlay(frame)
+                            imshow('Video Player', frame_with_status)
+                            self.current_frame += 1 + skipped
+
+                            frame_interval = self.frame_interval
+                            if gen != shown_gen:
+                                # First frame after a seek or video change starts a new timeline
+                                shown_gen = gen
+                                self.next_deadline = now
+                            self.next_deadline += frame_interval
+
+                            # More than 2 frames behind: skip ahead rather than play catch-up
+                            frames_behind = int((now - self.next_deadline) / frame_interval)
+                            if frames_behind > 2:
+                                self.skip_frames(frames_behind)
+                                self.next_deadline = now + frame_interval
+
+                # Handle keyboard input, sleeping until the next frame is due
                 if self.is_playing:
-                    self.resume_audio()
-                    self.show_status("Playing")
+                    delay_ms = max(0, ceil((self.next_deadline - monotonic()) * 1000))
+                else:
+                    delay_ms = None  # Block until a key is pressed
+                if self.pending_seek_operations:
+                    # Wake up for the pending seeks, even while paused
+                    seek_ms = max(0, ceil((self.seek_deadline - monotonic()) * 1000))
+                    delay_ms = seek_ms if delay_ms is None else min(delay_ms, seek_ms)
+                if delay_ms is None:
+                    key = wait_key(0)
+                elif delay_ms or starved:
+                    key = wait_key(max(1, delay_ms))
                 else:
-                    self.pause_audio()
-                    self.show_status("Paused")
-            elif key == ord('m'):  # Mute toggle
-                self.is_muted = not self.is_muted
-                self.set_audio_volume(self.is_muted)
-                self.show_status("Muted" if self.is_muted else "Unmuted")
-            elif key == 81 or key == 2:  # Left arrow - seek backward (short)
-                self.throttled_seek(-self.seek_short)
-            elif key == 83 or key == 3:  # Right arrow - seek forward (short)
-                self.throttled_seek(self.seek_short)
-            elif key == 82 or key == 0:  # Up arrow - seek forward (long)
-                self.throttled_seek(self.seek_long)
-            elif key == 84 or key == 1:  # Down arrow - seek backward (long)
-                self.throttled_seek(-self.seek_long)
-            elif key == ord('s'):  # Start of video
-                self.seek_to_position(0)
-                self.show_status("Start of video")
-            elif key == ord('e'):  # End of video
-                duration = self.frame_count / self.fps
-                self.seek_to_position(duration - 5)  # 5 seconds before end
-                self.show_status("End of video")
-            elif key == ord('j'):  # Previous video
-                self.prev_video()
-            elif key == ord('k') or key == 13:  # Next video (k or Enter)
-                # Always allow next video, whether playing or paused
-                self.next_video()
-            elif key == ord(']'):  # Speed up 10%
-                self.change_playback_speed(0.1)
-                self.update_window_title(self.video_files[self.current_index].name)
-            elif key == ord('['):  # Speed down 10%
-                self.change_playback_speed(-0.1)
-                self.update_window_title(self.video_files[self.current_index].name)
-
-        # Cleanup
+                    # Next frame already due: handle window events without sleeping
+                    key = poll_key()
+                key &= 0xFF
+
+                action = keymap.get(key)
+                if action:
+                    action()
+        finally:
+            self.close()
+
+    def close(self):
+        """Stop playback threads and audio, and save positions"""
+        self.stop_decoder()
+        self.cancel_prefetch()
+        self.executor.shutdown(wait=True)
+        # A killed probe returns at once, so this doesn't wait for ffprobe to finish
+        self.stop_keyframe_probe()
+        self.probe_executor.shutdown(wait=True)
         if self.cap:
             # Save current timestamp
-            current_time = self.cap.get(cv2.CAP_PROP_POS_MSEC) / 1000.0
-            self.timestamps[str(self.video_files[self.current_index])] = current_time
-            self.cap.release()
+            self.remember_position()
+            # The decoder may have outlived the join timeout mid-grab(); wait for it to let go
+            with self.cap_lock:
+                self.cap.release()
+                self.cap = None
 
-        # Cancel any pending seek operations
-        if self.seek_throttle_timer:
-            self.seek_throttle_timer.cancel()
+        # Drop any pending seek operations
+        self.pending_seek_operations.clear()
+        self.pending_seek_offset = 0
 
         # Stop audio
         self.stop_audio()
@@ -652,10 +1312,23 @@ def main():
                        help='Throttle delay for rapid seeking in seconds (default: 0.2)')
     parser.add_argument('--continuous', action='store_true',
                        help='Continuous playing mode - auto-advance to next video (default: pause at end)')
+    parser.add_argument('--decode-threads', type=int, default=0,
+                       help='Number of FFmpeg decoding threads, 0 for one per CPU core; '
+                            'ignored by OpenCV without CAP_PROP_N_THREADS (default: 0)')
 
     args = parser.parse_args()
 
-    player = VideoPlayer(args.path, args.seek_short, args.seek_long, args.throttle_delay, args.continuous)
+    # Older OpenCV can't request hardware decoding per capture; ask FFmpeg directly
+    # instead, unless the user configured the capture options themselves
+    if not hasattr(cv2, 'CAP_PROP_HW_ACCELERATION'):
+        os.environ.setdefault('OPENCV_FFMPEG_CAPTURE_OPTIONS', f'hwaccel;{ffmpeg_hwaccel()}')
+
+    # Keep OpenCV's own thread pool small; decoding has its dedicated threads
+    cv2.setNumThreads(2)
+    cv2.setUseOptimized(True)
+
+    player = VideoPlayer(args.path, args.seek_short, args.seek_long, args.throttle_delay, args.continuous,
+                         args.decode_threads)
 
     logger = logging.getLogger(__name__)
     logger.info("Controls:")
@@ -674,8 +1347,6 @@ def main():
         logger.info("\nContinuous mode: Videos will auto-advance")
     else:
         logger.info("\nPause mode: Videos will pause at end, press Enter for next video")
-    print()
-    print()
 
     try:
         player.play()
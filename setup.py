@@ -36,6 +36,9 @@ setup(
     ],
     python_requires=">=3.6",
     install_requires=requirements,
+    extras_require={
+        "fast": ["orjson>=3.0"],
+    },
     entry_points={
         "console_scripts": [
             "pp=pp:main",
@@ -0,0 +1,9 @@
+"""
+Shared pytest configuration for the test suite
+"""
+
+import sys
+from pathlib import Path
+
+# Make the pp module importable from the repository root, once per session
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
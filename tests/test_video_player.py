@@ -1,51 +1,65 @@
-#!/usr/bin/env python3
 """
 Unit tests for VideoPlayer class
 """
 
 import unittest
 import tempfile
+import shutil
 import json
+import time
+import subprocess
 import cv2
+import numpy as np
 from pathlib import Path
+from types import SimpleNamespace
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, patch, MagicMock
 import sys
 import os
 
-# Add parent directory to path to import pp module
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from pp import VideoPlayer
+from pp import LazyModule, VideoPlayer, ffmpeg_hwaccel, read_keyframes, start_keyframe_probe
 
 
 class TestVideoPlayer(unittest.TestCase):
     """Test cases for VideoPlayer class"""
 
-    def setUp(self):
-        """Set up test fixtures"""
-        self.temp_dir = tempfile.mkdtemp()
-        self.temp_path = Path(self.temp_dir)
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures shared by all tests in the class"""
+        cls.temp_dir = tempfile.mkdtemp()
+        cls.temp_path = Path(cls.temp_dir)
 
         # Create test video files
-        self.test_files = [
-            self.temp_path / "video1.mp4",
-            self.temp_path / "video2.avi",
-            self.temp_path / "video3.mkv",
-            self.temp_path / "not_video.txt"
+        cls.test_files = [
+            cls.temp_path / "video1.mp4",
+            cls.temp_path / "video2.avi",
+            cls.temp_path / "video3.mkv",
+            cls.temp_path / "not_video.txt"
         ]
 
         # Create the files
-        for file_path in self.test_files:
-            file_path.touch()
+        for file_path in cls.test_files:
+            open(file_path, 'wb').close()
 
-    def tearDown(self):
-        """Clean up test fixtures"""
-        import shutil
-        shutil.rmtree(self.temp_dir)
+        # For tests that only read a freshly constructed player
+        cls.shared_player = VideoPlayer(str(cls.temp_path))
+
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up test fixtures shared by all tests in the class"""
+        shutil.rmtree(cls.temp_dir, ignore_errors=True)
+
+    def make_private_dir(self) -> Path:
+        """Copy of the fixture files for tests that modify the directory"""
+        temp_path = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, temp_path, ignore_errors=True)
+        for file_path in self.test_files:
+            open(temp_path / file_path.name, 'wb').close()
+        return temp_path
 
     def test_init_with_directory(self):
         """Test VideoPlayer initialization with directory path"""
-        player = VideoPlayer(str(self.temp_path))
+        player = self.shared_player
 
         # Should find 3 video files (excluding .txt)
         self.assertEqual(len(player.video_files), 3)
@@ -73,7 +87,7 @@ class TestVideoPlayer(unittest.TestCase):
 
     def test_load_video_files(self):
         """Test loading video files from directory"""
-        player = VideoPlayer(str(self.temp_path))
+        player = self.shared_player
 
         # Check that only video files are loaded
         video_extensions = {'.mp4', '.avi', '.mkv'}
@@ -82,12 +96,29 @@ class TestVideoPlayer(unittest.TestCase):
 
     def test_video_extensions_filtering(self):
         """Test that non-video files are filtered out"""
-        player = VideoPlayer(str(self.temp_path))
+        player = self.shared_player
 
         # Should not include .txt file
         txt_file = self.temp_path / "not_video.txt"
         self.assertNotIn(txt_file, player.video_files)
 
+    def test_directory_listing_cache(self):
+        """Test unchanged directories are listed from cache"""
+        temp_path = self.make_private_dir()
+        player = VideoPlayer(str(temp_path))
+
+        with patch('pp.os.scandir') as mock_scandir:
+            player.load_video_files()
+            mock_scandir.assert_not_called()
+        self.assertEqual(len(player.video_files), 3)
+
+        # Adding a video changes the directory mtime and forces a rescan
+        open(temp_path / "video4.mp4", 'wb').close()
+        st = os.stat(temp_path)
+        os.utime(temp_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1))
+        player.load_video_files()
+        self.assertEqual(len(player.video_files), 4)
+
     def test_timestamps_functionality(self):
         """Test timestamp saving and loading"""
         player = VideoPlayer(str(self.temp_path))
@@ -99,17 +130,18 @@ class TestVideoPlayer(unittest.TestCase):
 
         self.assertEqual(player.timestamps[test_file], test_timestamp)
 
-    @patch('pp.cv2.VideoCapture')
+    @patch('pp.cv2.VideoCapture', new_callable=Mock)
     def test_load_video_success(self, mock_cv2_capture):
         """Test successful video loading"""
         # Mock cv2.VideoCapture
         mock_cap = Mock()
         mock_cap.isOpened.return_value = True
-        mock_cap.get.side_effect = lambda prop: {
+        props = {
             cv2.CAP_PROP_FPS: 30.0,
             cv2.CAP_PROP_FRAME_COUNT: 1800.0,
             cv2.CAP_PROP_POS_MSEC: 0.0
-        }.get(prop, 0.0)
+        }
+        mock_cap.get.side_effect = lambda prop: props.get(prop, 0.0)
         mock_cv2_capture.return_value = mock_cap
 
         player = VideoPlayer(str(self.temp_path))
@@ -120,7 +152,7 @@ class TestVideoPlayer(unittest.TestCase):
         self.assertTrue(result)
         mock_cv2_capture.assert_called_once()
 
-    @patch('pp.cv2.VideoCapture')
+    @patch('pp.cv2.VideoCapture', new_callable=Mock)
     def test_load_video_failure(self, mock_cv2_capture):
         """Test video loading failure"""
         # Mock cv2.VideoCapture to fail
@@ -134,6 +166,101 @@ class TestVideoPlayer(unittest.TestCase):
         result = player.load_video(0)
 
         self.assertFalse(result)
+        mock_cap.release.assert_called()
+        self.assertIsNone(player.cap)
+        self.assertIsNone(player.current_key)
+        self.assertFalse(player.remember_position())
+
+    @patch('pp.cv2.VideoCapture', new_callable=Mock)
+    def test_load_video_uses_cached_stream_info(self, mock_cv2_capture):
+        """Test stream info saved with the timestamp replaces backend lookups"""
+        mock_cap = Mock()
+        mock_cap.isOpened.return_value = True
+        mock_cv2_capture.return_value = mock_cap
+
+        player = VideoPlayer(str(self.temp_path))
+        key = player.video_key(player.video_files[0])
+        player.timestamps[key] = {'f': 250, 'fps': 25.0, 'n': 500}
+
+        with patch.object(player, 'update_window_title'):
+            self.assertTrue(player.load_video(0))
+
+        mock_cap.get.assert_not_called()
+        self.assertEqual(player.fps, 25.0)
+        self.assertEqual(player.duration, 20.0)
+        mock_cap.set.assert_called_with(cv2.CAP_PROP_POS_FRAMES, 250)
+
+    @patch('pp.cv2.VideoCapture', new_callable=Mock)
+    def test_load_video_finished_starts_over(self, mock_cv2_capture):
+        """Test a position saved at the end of a video is not restored"""
+        mock_cap = Mock()
+        mock_cap.isOpened.return_value = True
+        mock_cv2_capture.return_value = mock_cap
+
+        player = VideoPlayer(str(self.temp_path))
+        key = player.video_key(player.video_files[0])
+        player.timestamps[key] = {'f': 500, 'fps': 25.0, 'n': 500}
+
+        with patch.object(player, 'update_window_title'):
+            self.assertTrue(player.load_video(0))
+
+        self.assertNotIn(cv2.CAP_PROP_POS_FRAMES, [c[0][0] for c in mock_cap.set.call_args_list])
+        self.assertEqual(player.current_frame, 0)
+
+    @patch('pp.cv2.VideoCapture', new_callable=Mock)
+    def test_open_capture_software_fallback(self, mock_cv2_capture):
+        """Test fallback to software decoding when hardware decoding fails"""
+        hw_cap = Mock()
+        hw_cap.isOpened.return_value = False
+        sw_cap = Mock()
+        mock_cv2_capture.side_effect = [hw_cap, sw_cap]
+
+        player = VideoPlayer(str(self.temp_path))
+        video_path = player.video_files[0]
+
+        result = player.open_capture(video_path)
+
+        self.assertIs(result, sw_cap)
+        hw_cap.release.assert_called_once()
+        mock_cv2_capture.assert_called_with(str(video_path))
+        sw_cap.set.assert_called_once_with(cv2.CAP_PROP_BUFFERSIZE, 1)
+
+    @patch('pp.cv2.VideoCapture', new_callable=Mock)
+    def test_open_capture_decode_threads(self, mock_cv2_capture):
+        """Test the FFmpeg decoder thread count is passed to the capture"""
+        player = VideoPlayer(str(self.temp_path), decode_threads=2)
+
+        player.open_capture(player.video_files[0])
+
+        args = mock_cv2_capture.call_args[0]
+        self.assertEqual(args[1], cv2.CAP_FFMPEG)
+        params = args[2]
+        self.assertEqual(params[params.index(cv2.CAP_PROP_N_THREADS) + 1], 2)
+
+    def test_ffmpeg_hwaccel_per_platform(self):
+        """Test the FFmpeg hardware decoder matches the platform"""
+        for platform, expected in [('darwin', 'videotoolbox'), ('win32', 'd3d11va'), ('linux', 'vaapi')]:
+            with patch('pp.sys.platform', platform):
+                self.assertEqual(ffmpeg_hwaccel(), expected)
+
+    def test_help_skips_heavy_imports(self):
+        """Test --help exits without importing OpenCV or NumPy"""
+        code = ("import sys, pp\n"
+                "sys.argv = ['pp', '--help']\n"
+                "try:\n"
+                "    pp.main()\n"
+                "except SystemExit:\n"
+                "    pass\n"
+                "print(sorted({'cv2', 'numpy'} & set(sys.modules)))")
+        result = subprocess.run([sys.executable, '-c', code], stdout=subprocess.PIPE,
+                                cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        self.assertEqual(result.stdout.decode().splitlines()[-1], '[]')
+
+    def test_lazy_module_caches_attributes(self):
+        """Test attributes of a lazily imported module are looked up through it only once"""
+        proxy = LazyModule('json')
+        self.assertIs(proxy.dumps, json.dumps)
+        self.assertIs(vars(proxy)['dumps'], json.dumps)
 
     def test_load_video_invalid_index(self):
         """Test loading video with invalid index"""
@@ -147,30 +274,282 @@ class TestVideoPlayer(unittest.TestCase):
         result = player.load_video(len(player.video_files))
         self.assertFalse(result)
 
-    @patch('pp.cv2.VideoCapture')
+    @patch('pp.cv2.VideoCapture', new_callable=Mock)
     def test_seek_functionality(self, mock_cv2_capture):
         """Test seeking functionality"""
         # Mock cv2.VideoCapture
         mock_cap = Mock()
-        mock_cap.get.side_effect = lambda prop: {
+        props = {
             cv2.CAP_PROP_POS_MSEC: 10000.0,  # 10 seconds
             cv2.CAP_PROP_FPS: 30.0,
             cv2.CAP_PROP_FRAME_COUNT: 1800.0
-        }.get(prop, 0.0)
+        }
+        mock_cap.get.side_effect = lambda prop: props.get(prop, 0.0)
         mock_cv2_capture.return_value = mock_cap
 
         player = VideoPlayer(str(self.temp_path))
         player.cap = mock_cap
         player.fps = 30.0
         player.frame_count = 1800
+        player.duration = 60.0
+        player.current_frame = 300  # 10 seconds
 
         # Test seeking forward
         player.seek(10)
-        mock_cap.set.assert_called_with(cv2.CAP_PROP_POS_MSEC, 20000.0)
+        mock_cap.set.assert_called_with(cv2.CAP_PROP_POS_FRAMES, 600)
 
-        # Test seeking backward
+        # Test seeking backward (from the new 20 second position)
         player.seek(-5)
-        mock_cap.set.assert_called_with(cv2.CAP_PROP_POS_MSEC, 5000.0)
+        mock_cap.set.assert_called_with(cv2.CAP_PROP_POS_FRAMES, 450)
+
+        # Seeking past either end stops at the first/last frame
+        player.seek(-60)
+        self.assertEqual(player.current_frame, 0)
+        player.seek(120)
+        self.assertEqual(player.current_frame, 1799)
+
+    def test_scrub_seeks_by_frame(self):
+        """Test scrubbing without a keyframe index seeks to the exact frame"""
+        mock_cap = Mock()
+
+        player = VideoPlayer(str(self.temp_path))
+        player.cap = mock_cap
+        player.fps = 30.0
+
+        player._scrub_to(180)
+
+        mock_cap.set.assert_called_once_with(cv2.CAP_PROP_POS_FRAMES, 180)
+        self.assertEqual(player.current_frame, 180)
+        mock_cap.read.assert_not_called()
+
+    def test_scrub_uses_keyframe_index(self):
+        """Test scrubbing jumps to the closest keyframe before the target"""
+        mock_cap = Mock()
+        mock_cap.grab.return_value = True
+
+        player = VideoPlayer(str(self.temp_path))
+        player.cap = mock_cap
+        player.fps = 30.0
+        player.set_keyframes([0.0, 2.0, 4.0, 6.0])
+
+        player._scrub_to(150)
+
+        mock_cap.set.assert_called_once_with(cv2.CAP_PROP_POS_FRAMES, 120)
+        self.assertEqual(mock_cap.grab.call_count, 30)
+        self.assertEqual(player.current_frame, 150)
+
+    @patch('pp.subprocess.Popen')
+    def test_probe_keyframes(self, mock_popen):
+        """Test keyframe times are parsed from ffprobe packet flags"""
+        process = Mock(returncode=0)
+        process.communicate.return_value = (b"0.000000,K__\n0.033367,___\n2.002000,K_\nN/A,K__\n", None)
+        mock_popen.return_value = process
+        self.assertEqual(read_keyframes(start_keyframe_probe(Path('video.mp4'))), [0.0, 2.002])
+
+        # Killed or failed probes give no index
+        process.returncode = -9
+        self.assertIsNone(read_keyframes(process))
+
+        mock_popen.side_effect = FileNotFoundError
+        self.assertIsNone(start_keyframe_probe(Path('video.mp4')))
+
+    def test_keyframe_probe_timeout(self):
+        """Test a keyframe probe that runs too long is killed"""
+        process = Mock()
+        process.communicate.side_effect = [subprocess.TimeoutExpired('ffprobe', 1), (b'', None)]
+        self.assertIsNone(read_keyframes(process, timeout=1))
+        process.kill.assert_called_once()
+
+    def test_keyframe_index_applied_by_main_loop(self):
+        """Test probed keyframe indexes are kept in memory and applied to the current video only"""
+        player = VideoPlayer(str(self.temp_path))
+        player.fps = 25.0
+        player.current_key = 'key'
+        player.changed_keys.clear()
+        player.keyframe_q.put(('other', [0.0, 2.0]))
+        player.keyframe_q.put(('key', [0.0, 4.0]))
+
+        player.apply_keyframes()
+
+        self.assertEqual(player.keyframe_times, {'other': [0.0, 2.0], 'key': [0.0, 4.0]})
+        self.assertEqual(player.keyframes.tolist(), [0, 100])
+        # Nothing is written to the timestamp file
+        self.assertEqual(player.changed_keys, set())
+
+    def test_decoder_reuses_frame_buffers(self):
+        """Test decoded frames are retrieved into a ring of reused buffers"""
+        mock_cap = Mock()
+        mock_cap.grab.side_effect = [True] * 12 + [False] * 100
+        mock_cap.retrieve.side_effect = lambda buf: (True, buf if buf is not None else np.zeros((4, 4, 3), np.uint8))
+
+        player = VideoPlayer(str(self.temp_path))
+        player.cap = mock_cap
+        player.decode_enabled.set()
+        player.start_decoder()
+        self.addCleanup(player.stop_decoder)
+
+        frames = [player.frame_q.get(timeout=1)[2] for _ in range(12)]
+
+        ring = player.frame_q.maxsize + 2
+        self.assertEqual(len({id(frame) for frame in frames}), ring)
+        self.assertIs(frames[0], frames[ring])
+        mock_cap.read.assert_not_called()
+
+    def test_fast_playback_retrieves_displayed_frames_only(self):
+        """Test playback faster than 2x grabs past frames that are not shown"""
+        mock_cap = Mock()
+        mock_cap.grab.side_effect = [True] * 9 + [False] * 100
+        mock_cap.retrieve.return_value = (True, np.zeros((4, 4, 3), np.uint8))
+
+        player = VideoPlayer(str(self.temp_path))
+        player.cap = mock_cap
+        player.change_playback_speed(2.0)  # 3.0x
+        self.assertEqual(player.frame_step, 3)
+
+        player.decode_enabled.set()
+        player.start_decoder()
+        self.addCleanup(player.stop_decoder)
+
+        skipped = [player.frame_q.get(timeout=1)[3] for _ in range(3)]
+        self.assertEqual(skipped, [2, 2, 2])
+        self.assertEqual(mock_cap.retrieve.call_count, 3)
+
+    def test_seek_discards_queued_frames(self):
+        """Test that seeking drops frames decoded before the seek"""
+        mock_cap = Mock()
+        mock_cap.get.return_value = 0.0
+        mock_cap.grab.return_value = False
+
+        player = VideoPlayer(str(self.temp_path))
+        player.cap = mock_cap
+        player.fps = 30.0
+        player.frame_count = 1800
+
+        gen = player.seek_gen
+        player.frame_q.put((gen, True, None))
+
+        player.seek(10)
+
+        self.assertTrue(player.frame_q.empty())
+        self.assertNotEqual(player.seek_gen, gen)
+        self.assertTrue(player.decode_enabled.is_set())
+
+    def test_seek_cancels_pending_frame_skip(self):
+        """Test that a seek cancels catch-up skipping requested before it"""
+        mock_cap = Mock()
+        mock_cap.get.return_value = 0.0
+        mock_cap.grab.return_value = False
+
+        player = VideoPlayer(str(self.temp_path))
+        player.cap = mock_cap
+        player.duration = 60.0
+
+        player.skip_frames(5)
+        self.assertEqual(player.frames_to_skip, 5)
+
+        player.seek_to_position(30)
+        self.assertEqual(player.frames_to_skip, 0)
+
+    def test_throttled_seek_holds_decoder(self):
+        """Test that rapid seeks invalidate frames and pause decoding until executed"""
+        player = VideoPlayer(str(self.temp_path))
+        player.decode_enabled.set()
+        gen = player.seek_gen
+        player.frame_q.put((gen, True, None))
+
+        player.throttled_seek(10)
+        player.throttled_seek(10)
+        self.assertGreater(player.seek_deadline, time.monotonic())
+
+        self.assertTrue(player.frame_q.empty())
+        self.assertGreater(player.seek_gen, gen)
+        self.assertFalse(player.decode_enabled.is_set())
+        self.assertEqual(player.pending_seek_operations, [10, 10])
+
+    def test_seek_burst_restarts_audio_once(self):
+        """Test a throttled seek burst spawns a single audio process"""
+        player = VideoPlayer(str(self.temp_path))
+        player.cap = Mock()
+        player.fps = 30.0
+        player.frame_count = 3000
+        player.audio_available = True
+
+        with patch.object(player, 'stop_audio') as mock_stop, \
+             patch.object(player, 'play_audio') as mock_play:
+            for _ in range(5):
+                player.throttled_seek(10)
+            player.seek(10)  # Joins the pending burst
+            mock_stop.assert_not_called()
+            mock_play.assert_not_called()
+
+            player.execute_throttled_seeks()
+            mock_stop.assert_called_once()
+            mock_play.assert_called_once()
+
+    def test_seek_joining_burst_not_multiplied(self):
+        """Test a direct seek during a burst doesn't count towards the fast seek multiplier"""
+        player = VideoPlayer(str(self.temp_path))
+        player.cap = Mock()
+        player.fps = 30.0
+        player.frame_count = 30000
+
+        player.throttled_seek(10)
+        player.throttled_seek(10)
+        player.seek(10)
+        with patch.object(player, '_scrub_to') as mock_scrub:
+            player.execute_throttled_seeks()
+
+        mock_scrub.assert_called_once_with(900)
+        self.assertEqual(player.pending_seek_offset, 0)
+
+    @patch('pp.cv2.destroyAllWindows')
+    def test_close_releases_capture_under_lock(self, mock_destroy):
+        """Test the capture is released only while the decoder can't be using it"""
+        player = VideoPlayer(str(self.temp_path))
+        player.executor = ThreadPoolExecutor(max_workers=1)
+        player.probe_executor = ThreadPoolExecutor(max_workers=1)
+        cap = Mock()
+        cap.release.side_effect = lambda: self.assertTrue(player.cap_lock.locked())
+        player.cap = cap
+
+        with patch.object(player, 'save_timestamps'):
+            player.close()
+
+        cap.release.assert_called_once()
+        self.assertIsNone(player.cap)
+
+    def test_prefetch_next_video(self):
+        """Test the next video's capture is opened ahead and reused on switch"""
+        player = VideoPlayer(str(self.temp_path))
+        player.executor = ThreadPoolExecutor(max_workers=1)
+        self.addCleanup(player.executor.shutdown)
+        next_cap = Mock()
+
+        with patch.object(player, 'open_capture', return_value=next_cap) as mock_open:
+            player.prefetch_next()
+            self.assertIs(player.take_prefetched(1), next_cap)
+            mock_open.assert_called_once_with(player.video_files[1])
+
+            # A prefetch for a different video is released, not used
+            player.prefetch_next()
+            player.prefetch[1].result()  # Wait until opened
+            self.assertIsNone(player.take_prefetched(2))
+            next_cap.release.assert_called_once()
+
+    def test_keymap_dispatch(self):
+        """Test key codes map to player actions"""
+        with patch.object(VideoPlayer, 'throttled_seek') as mock_seek:
+            player = VideoPlayer(str(self.temp_path))
+            player._keymap[81]()  # Left
+            player._keymap[0]()  # Up (macOS)
+        self.assertEqual(mock_seek.call_args_list, [((-10,),), ((60,),)])
+
+        player._keymap[ord(' ')]()
+        self.assertFalse(player.is_playing)
+
+        player.running = True
+        player._keymap[27]()  # ESC
+        self.assertFalse(player.running)
 
     def test_next_video(self):
         """Test next video functionality"""
@@ -192,59 +571,134 @@ class TestVideoPlayer(unittest.TestCase):
             expected_index = (initial_index - 1) % len(player.video_files)
             mock_load.assert_called_once_with(expected_index)
 
-    def test_save_load_timestamps(self):
-        """Test timestamp persistence"""
-        player = VideoPlayer(str(self.temp_path))
+    def test_video_key_tracks_file_identity(self):
+        """Test timestamp keys survive renames but change when content changes"""
+        temp_path = self.make_private_dir()
+        player = VideoPlayer(str(temp_path))
+        video_file = temp_path / self.test_files[0].name
 
-        # Set some test timestamps
-        test_data = {
-            "video1.mp4": 123.45,
-            "video2.avi": 67.89
-        }
-        player.timestamps = test_data
+        key = player.video_key(video_file)
+        renamed = temp_path / "renamed.mp4"
+        video_file.rename(renamed)
+        self.assertEqual(player.video_key(renamed), key)
 
-        # Save timestamps
-        player.save_timestamps()
+        renamed.write_bytes(b"changed")
+        self.assertNotEqual(player.video_key(renamed), key)
 
-        # Create new player instance and load timestamps
-        new_player = VideoPlayer(str(self.temp_path))
+    def test_remember_position_requires_min_watch_time(self):
+        """Test that barely watched videos are not bookmarked"""
+        player = VideoPlayer(str(self.temp_path))
+        player.cap = SimpleNamespace()  # Only checked for presence
+        player.fps = 30.0
+        player.current_frame = 1260  # 42 seconds
+        player.current_key = "key"
+        player.changed_keys.clear()
+
+        player.video_loaded_at = time.monotonic()
+        self.assertFalse(player.remember_position())
+        self.assertNotIn("key", player.timestamps)
+        self.assertFalse(player.changed_keys)
 
-        # Check if timestamps were loaded correctly
-        timestamp_file = Path.home() / '.pp_timestamps.json'
-        if timestamp_file.exists():
-            with open(timestamp_file, 'r') as f:
-                loaded_data = json.load(f)
+        player.video_loaded_at = time.monotonic() - player.min_watch_time
+        self.assertTrue(player.remember_position())
+        self.assertEqual(player.timestamps["key"]['f'], 1260)
+        self.assertEqual(player.changed_keys, {"key"})
 
-            # Clean up
-            timestamp_file.unlink()
+        # Watched to the end: starts over next time
+        player.frame_count = 1800
+        player.current_frame = 1800
+        self.assertTrue(player.remember_position())
+        self.assertEqual(player.timestamps["key"]['f'], 0)
 
-            # Verify data matches
-            for key, value in test_data.items():
-                if key in loaded_data:
-                    self.assertEqual(loaded_data[key], value)
+    def test_save_load_timestamps(self):
+        """Test timestamp persistence"""
+        temp_path = self.make_private_dir()
+        with patch('pp._TS_PATH', temp_path / 'timestamps.jsonl'), \
+             patch('pp._LEGACY_TS_PATH', temp_path / 'timestamps.json'):
+            player = VideoPlayer(str(temp_path))
+
+            # Set some test timestamps
+            test_data = {
+                "video1.mp4": 123.45,
+                "video2.avi": 67.89
+            }
+            player.timestamps = test_data
+            player.changed_keys.update(test_data)
+
+            # Save timestamps
+            player.save_timestamps()
+
+            # Create new player instance and load timestamps
+            new_player = VideoPlayer(str(temp_path))
+
+        # Verify data matches
+        for key, value in test_data.items():
+            self.assertEqual(new_player.timestamps[key], value)
+
+    def test_timestamp_records_appended(self):
+        """Test saving appends changed keys only and compacts superseded records"""
+        temp_path = self.make_private_dir()
+        (temp_path / 'state').mkdir()
+        ts_path = temp_path / 'state' / 'timestamps.jsonl'
+        with patch('pp._TS_PATH', ts_path):
+            player = VideoPlayer(str(temp_path))
+            player.timestamps = {'a': 1.0, 'b': 2.0}
+            player.changed_keys = {'a', 'b'}
+            player.save_timestamps()
+
+            player.timestamps['a'] = 3.0
+            player.changed_keys.add('a')
+            player.save_timestamps()
+            self.assertEqual(len(ts_path.read_bytes().splitlines()), 3)
+            self.assertEqual(VideoPlayer(str(temp_path)).timestamps['a'], 3.0)
+
+            # Superseded records are dropped once they outnumber live ones
+            for value in (4.0, 5.0):
+                player.timestamps['a'] = value
+                player.changed_keys.add('a')
+                player.save_timestamps()
+            self.assertEqual(len(ts_path.read_bytes().splitlines()), 2)
+            loaded = VideoPlayer(str(temp_path)).timestamps
+            self.assertEqual((loaded['a'], loaded['b']), (5.0, 2.0))
+
+    def test_torn_timestamp_record(self):
+        """Test a record appended after a torn one is kept"""
+        temp_path = self.make_private_dir()
+        ts_path = temp_path / 'timestamps.jsonl'
+        ts_path.write_bytes(b'["a", 1.0]\n["b", 2')
+        with patch('pp._TS_PATH', ts_path):
+            player = VideoPlayer(str(temp_path))
+            player.timestamps['c'] = 3.0
+            player.changed_keys = {'c'}
+            player.save_timestamps()
+            loaded = VideoPlayer(str(temp_path)).timestamps
+        self.assertEqual(loaded['a'], 1.0)
+        self.assertEqual(loaded['c'], 3.0)
+        self.assertNotIn('b', loaded)
 
 
 class TestVideoPlayerIntegration(unittest.TestCase):
     """Integration tests for VideoPlayer"""
 
-    def setUp(self):
-        """Set up test fixtures"""
-        self.temp_dir = tempfile.mkdtemp()
-        self.temp_path = Path(self.temp_dir)
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures shared by all tests in the class"""
+        cls.temp_dir = tempfile.mkdtemp()
+        cls.temp_path = Path(cls.temp_dir)
 
         # Create test video files
-        self.test_files = [
-            self.temp_path / "test1.mp4",
-            self.temp_path / "test2.avi",
+        cls.test_files = [
+            cls.temp_path / "test1.mp4",
+            cls.temp_path / "test2.avi",
         ]
 
-        for file_path in self.test_files:
-            file_path.touch()
+        for file_path in cls.test_files:
+            open(file_path, 'wb').close()
 
-    def tearDown(self):
-        """Clean up test fixtures"""
-        import shutil
-        shutil.rmtree(self.temp_dir)
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up test fixtures shared by all tests in the class"""
+        shutil.rmtree(cls.temp_dir, ignore_errors=True)
 
     def test_full_initialization_flow(self):
         """Test complete initialization flow"""
@@ -258,4 +712,4 @@ class TestVideoPlayerIntegration(unittest.TestCase):
 
 
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    unittest.main()